@@ -53,6 +53,8 @@ if config.is_building_docs():
     from qiskit_metal._gui.elements_window import ElementTableModel
     from qiskit_metal._gui.widgets.all_components.table_view_all_components import QTableView_AllComponents
     from qiskit_metal._gui.widgets.all_components.table_model_all_components import QTableModel_AllComponents
+    from qiskit_metal._gui.widgets.all_components.delegate_all_components import SpeedUpDelegate
+    from qiskit_metal._gui.widgets.all_components.delegate_all_components import ComponentsRowCacheDelegate
     from qiskit_metal._gui.widgets.bases.dict_tree_base import BranchNode
     from qiskit_metal._gui.widgets.bases.dict_tree_base import LeafNode
     from qiskit_metal._gui.widgets.bases.dict_tree_base import QTreeModel_Base
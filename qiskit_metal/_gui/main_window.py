@@ -42,6 +42,7 @@ from .renderer_hfss_gui import RendererHFSSWidget
 from .renderer_q3d_gui import RendererQ3DWidget
 from .utility._handle_qt_messages import slot_catch_error
 from .utility._toolbox_qt import doShowHighlighWidget
+from .widgets.all_components.delegate_all_components import ComponentsRowCacheDelegate
 from .widgets.all_components.table_model_all_components import \
     QTableModel_AllComponents
 from .widgets.build_history.build_history_scroll_area import \
@@ -391,6 +392,7 @@ class MetalGUI(QMainWindowBaseHandler):
             self.main_window.q3d_gui.set_design(design)
 
         self.variables_window.set_design(design)
+        self.ui.tableComponents.model().set_design(design)
 
         # Refresh
         self.refresh()
@@ -564,6 +566,8 @@ class MetalGUI(QMainWindowBaseHandler):
                                           logger=self.logger,
                                           tableView=self.ui.tableComponents)
         self.ui.tableComponents.setModel(model)
+        self.ui.tableComponents.setItemDelegate(
+            ComponentsRowCacheDelegate(self.ui.tableComponents))
 
     def _create_new_component_object_from_qlibrary(self, full_path: str):
         """
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Delegate for display of the QComponents in the all-components table
+"""
+
+from collections import OrderedDict
+
+from PySide2.QtCore import QModelIndex, Qt
+from PySide2.QtGui import QFontMetrics, QIcon, QPainter, QPalette, QPixmap
+from PySide2.QtWidgets import (QStyle, QStyledItemDelegate,
+                               QStyleOptionViewItem, QTableView)
+
+from .table_model_all_components import MULTIPLE_ROLES
+
+
+class SpeedUpDelegate(QStyledItemDelegate):
+    """
+    Delegate for the all-components table view.
+    Requires QTableModel_AllComponents
+
+    The default delegate calls data() once per role for every cell it paints.
+    This delegate asks the model for all the roles at once, with
+    MULTIPLE_ROLES, and keeps the result for the most recently painted
+    indexes. The cache is cleared whenever the model signals a change.
+    """
+
+    max_cache_size = 500
+
+    def __init__(self, parent: QTableView):
+        """
+        Initializer for SpeedUpDelegate
+
+        Args:
+            parent (QTableView): The view, its model must already be set.
+        """
+        super().__init__(parent)
+        self._role_cache = OrderedDict()
+
+        model = parent.model()
+        model.modelReset.connect(self.clear_cache)
+        model.layoutChanged.connect(self.clear_cache)
+        model.rowsInserted.connect(self.clear_cache)
+        model.rowsRemoved.connect(self.clear_cache)
+        model.dataChanged.connect(self.clear_cache)
+
+    def clear_cache(self, *args):
+        """
+        Forget the data of all the indexes.
+
+        Args:
+            *args: Allows function to be a slot
+            even for signals that pass in args
+        """
+        self._role_cache.clear()
+
+    def get_role_data(self, index: QModelIndex) -> dict:
+        """
+        Get the data of all the painted roles of the index, from the cache if possible.
+
+        Args:
+            index (QModelIndex): Index to paint
+        Returns:
+            dict: Keys are the Qt roles, values are the data for that role
+        """
+        key = (index.row(), index.column())
+        cache = self._role_cache
+        role_data = cache.get(key)
+        if role_data is None:
+            # Call the python model directly, so that the dict does not
+            # go through a QVariant conversion.
+            role_data = index.model().data(index, MULTIPLE_ROLES) or {}
+            cache[key] = role_data
+            if len(cache) > self.max_cache_size:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return role_data
+
+    def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex):
+        """
+        Fill the style option from a single call to the model, instead of
+        one call per role as done by QStyledItemDelegate.
+
+        Args:
+            option (QStyleOptionViewItem): Option to initialize
+            index (QModelIndex): Index to paint
+        """
+        role_data = self.get_role_data(index)
+
+        font = role_data.get(Qt.FontRole)
+        if font is not None:
+            # Only override what the model sets, i.e. bold, and keep the
+            # family and size of the view's font.
+            option.font = font.resolve(option.font)
+            option.fontMetrics = QFontMetrics(option.font)
+
+        option.displayAlignment = Qt.AlignLeft | Qt.AlignVCenter
+        option.index = index
+
+        text = role_data.get(Qt.DisplayRole)
+        if text is not None:
+            option.features |= QStyleOptionViewItem.HasDisplay
+            option.text = text
+
+        brush = role_data.get(Qt.BackgroundRole)
+        if brush is not None:
+            option.backgroundBrush = brush
+
+        icon = role_data.get(Qt.DecorationRole)
+        if icon is not None:
+            option.features |= QStyleOptionViewItem.HasDecoration
+            option.icon = icon
+            option.decorationSize = icon.actualSize(option.decorationSize,
+                                                    QIcon.Normal, QIcon.On)
+
+
+class ComponentsRowCacheDelegate(SpeedUpDelegate):
+    """
+    Delegate for the all-components table view.
+    Requires QTableModel_AllComponents
+
+    Renders each cell once into a pixmap, and only blits that pixmap on the
+    following repaints, i.e. when scrolling. The pixmaps are keyed by the
+    cell, its size, its paint state and the device pixel ratio, and kept in
+    a bounded cache of the delegate rather than in the application-wide
+    QPixmapCache. When the model changes the data of some rows, only the
+    pixmaps of those rows are dropped.
+
+    Each pixmap is filled with the base color of the view before the cell is
+    rendered into it, so that the text keeps its subpixel antialiasing.
+    """
+
+    max_pixmaps = 500
+
+    # Bits of the paint state that change the look of a cell
+    _state_mask = (QStyle.State_Selected | QStyle.State_MouseOver |
+                   QStyle.State_HasFocus | QStyle.State_Active |
+                   QStyle.State_Enabled)
+
+    def __init__(self, parent: QTableView):
+        """
+        Initializer for ComponentsRowCacheDelegate
+
+        Args:
+            parent (QTableView): The view, its model must already be set.
+        """
+        super().__init__(parent)
+        # Pixmap of each cell key, least recently painted first
+        self._pixmaps = OrderedDict()
+        # Cell keys of each row, to drop the pixmaps of a row
+        self._pixmap_keys_by_row = {}
+
+        # Rows move when they are inserted or removed, so forget them all.
+        model = parent.model()
+        model.modelReset.connect(self.clear_pixmaps)
+        model.layoutChanged.connect(self.clear_pixmaps)
+        model.rowsInserted.connect(self.clear_pixmaps)
+        model.rowsRemoved.connect(self.clear_pixmaps)
+        model.dataChanged.connect(self.clear_rows_pixmaps)
+
+    def clear_pixmaps(self, *args):
+        """
+        Forget the pixmaps of all the cells.
+
+        Args:
+            *args: Allows function to be a slot
+            even for signals that pass in args
+        """
+        self._pixmaps.clear()
+        self._pixmap_keys_by_row.clear()
+
+    def clear_rows_pixmaps(self, top_left: QModelIndex,
+                           bottom_right: QModelIndex, *args):
+        """
+        Forget the pixmaps of the rows whose data changed.
+
+        Args:
+            top_left (QModelIndex): First changed index
+            bottom_right (QModelIndex): Last changed index
+            *args: Allows function to be a slot
+            even for signals that pass in args
+        """
+        first, last = top_left.row(), bottom_right.row()
+        keys_by_row = self._pixmap_keys_by_row
+        rows = range(first, last + 1)
+        if len(rows) > len(keys_by_row):
+            rows = [row for row in keys_by_row if first <= row <= last]
+        for row in rows:
+            for key in keys_by_row.pop(row, ()):
+                self._pixmaps.pop(key, None)
+
+    def _render_pixmap(self, option: QStyleOptionViewItem, index: QModelIndex,
+                       ratio: float) -> QPixmap:
+        """
+        Render the cell into a new pixmap.
+
+        Args:
+            option (QStyleOptionViewItem): Style of the cell
+            index (QModelIndex): Index to paint
+            ratio (float): Device pixel ratio of the view
+
+        Returns:
+            QPixmap: The cell, drawn at the origin
+        """
+        rect = option.rect
+        pixmap = QPixmap(rect.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+
+        # An opaque pixmap, unlike a transparent one, keeps the subpixel
+        # antialiasing of the text.
+        group = QPalette.Inactive
+        if option.state & QStyle.State_Active:
+            group = QPalette.Active
+        role = QPalette.Base
+        if option.features & QStyleOptionViewItem.Alternate:
+            role = QPalette.AlternateBase
+        pixmap.fill(option.palette.color(group, role))
+
+        cell_option = QStyleOptionViewItem(option)
+        cell_option.rect = rect.translated(-rect.topLeft())
+        pixmap_painter = QPainter(pixmap)
+        super().paint(pixmap_painter, cell_option, index)
+        pixmap_painter.end()
+        return pixmap
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem,
+              index: QModelIndex):
+        """
+        Blit the cached pixmap of the cell, rendering it first if needed.
+
+        Args:
+            painter (QPainter): Painter of the view
+            option (QStyleOptionViewItem): Style of the cell
+            index (QModelIndex): Index to paint
+        """
+        rect = option.rect
+        if rect.isEmpty():
+            return
+
+        ratio = painter.device().devicePixelRatioF()
+        row = index.row()
+        key = (row, index.column(), rect.width(), rect.height(),
+               int(option.state & self._state_mask), ratio)
+
+        pixmaps = self._pixmaps
+        pixmap = pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self._render_pixmap(option, index, ratio)
+            pixmaps[key] = pixmap
+            self._pixmap_keys_by_row.setdefault(row, set()).add(key)
+            if len(pixmaps) > self.max_pixmaps:
+                old_key, _ = pixmaps.popitem(last=False)
+                row_keys = self._pixmap_keys_by_row[old_key[0]]
+                row_keys.discard(old_key)
+                if not row_keys:
+                    del self._pixmap_keys_by_row[old_key[0]]
+        else:
+            pixmaps.move_to_end(key)
+
+        painter.drawPixmap(rect.topLeft(), pixmap)
@@ -12,19 +12,64 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
-import numpy as np
 from PySide2 import QtCore, QtWidgets
-from PySide2.QtCore import QAbstractTableModel, QModelIndex, Qt
-from PySide2.QtGui import QBrush, QColor, QFont, QIcon, QPixmap
-from PySide2.QtWidgets import QTableView
+from PySide2.QtCore import QAbstractTableModel, QEvent, QModelIndex, QObject, Qt
+from PySide2.QtGui import QBrush, QColor, QFont, QIcon
 
-from ...utility._handle_qt_messages import slot_catch_error
 from ...utility._toolbox_qt import blend_colors
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict
 
 if TYPE_CHECKING:
     from .table_view_all_components import QTableView_AllComponents
 
+# Custom role used by SpeedUpDelegate to get all the roles of a cell in a
+# single call to data(), instead of one call per role.
+MULTIPLE_ROLES = Qt.UserRole + 1
+
+# The roles returned, as a dict, when data() is called with MULTIPLE_ROLES.
+ROLES_TO_PAINT = (Qt.DisplayRole, Qt.FontRole, Qt.BackgroundRole,
+                  Qt.DecorationRole, Qt.ToolTipRole)
+
+# The roles that depend on the name or build status of a component.
+_CHANGED_ROLES = [
+    Qt.DisplayRole, Qt.BackgroundRole, Qt.DecorationRole, Qt.ToolTipRole
+]
+
+
+class _RowInfo:
+    """Strings shown for a component that only change with its name.
+
+    One is kept per row, so its attributes live in slots rather than in a
+    per-instance __dict__.
+    """
+    __slots__ = ('component', 'name', 'class_name', 'module', 'tooltip')
+
+    def __init__(self, component, name: str, class_name: str, module: str):
+        self.component = component
+        self.name = name
+        self.class_name = class_name
+        self.module = module
+        self.tooltip = _format_tooltip(name, class_name, module)
+
+
+# Text shown in each column, by column number.  Each function takes the
+# component and its row info, see QTableModel_AllComponents._row_info.
+_DISPLAY_FNS = (
+    lambda component, info: info.name,
+    lambda component, info: info.class_name,
+    lambda component, info: info.module,
+    lambda component, info: str(component.status),
+    lambda component, info: str(component.id),
+)
+
+# Background brushes of the components that failed to build, by the rgba of
+# the table view background they are blended with.
+_BLEND_CACHE = {}  # type: Dict[int, QBrush]
+
+# Bound method used to build the tooltip of a component.
+_format_tooltip = (
+    'Component name= "{}" instance of class "{}" from module "{}" ').format
+
 
 class QTableModel_AllComponents(QAbstractTableModel):
     """Design components Table model that shows the names of the components and
@@ -40,8 +85,11 @@ class QTableModel_AllComponents(QAbstractTableModel):
         model = t.model()
         index = model.index(1,0)
         model.data(index)
+
+    The model listens to the design (see QDesign.add_components_observer)
+    and inserts, removes or updates rows as components change.
     """
-    __timer_interval = 500  # ms
+    __resize_delay = 100  # ms
 
     def __init__(self,
                  gui,
@@ -63,56 +111,292 @@ class QTableModel_AllComponents(QAbstractTableModel):
             'Name', 'QComponent class', 'QComponent module', 'Build status',
             'id'
         ]
-        self._row_count = -1
-
-        self._create_timer()
+        # Read by the methods Qt calls for every cell.
+        self._column_tuple = tuple(self.columns)
+        self._column_count = len(self._column_tuple)
+        # Initial width of each column, in pixels, so the view does not need
+        # to measure every cell to lay out the columns.
+        self.column_widths = [150, 150, 250, 100, 40]
+
+        # Component ids in row order.  Kept in sync with the design's
+        # components through the design's components observers, so that
+        # data() does not materialize the whole key list for every cell and
+        # every role.
+        self._keys_cache = []
+        # Reverse of _keys_cache: row of each component id.  Built on demand,
+        # None when out of date.
+        self._rows_by_id = None
+
+        # Strings that do not change for a given component and name, by
+        # component id.  See _row_info.
+        self._row_infos = {}
+
+        # The design shown, swapped by set_design.  Kept here rather than
+        # read from the gui, since data() needs it for every cell.
+        self._design = gui.design if gui else None
+        # The design whose components observers include this model.
+        self._observed_design = None
+
+        # While the view is hidden, changes of the design are not applied to
+        # the rows; they are applied at once when the view is shown again.
+        self._needs_sync = False
+        if self._tableView:
+            self._tableView.installEventFilter(self)
+
+        # Qt objects returned by data().  They are the same for every cell,
+        # so build them once rather than on every paint.
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+        self._warn_icon = QIcon(":/sample_shapes/warning")
+        self._bad_color = QColor('#FF0000')
+        self._bad_brush_default = QBrush(self._bad_color)
+
+        # Every cell has the same flags, i.e. those of QAbstractTableModel for
+        # a valid index.
+        self._default_flags = Qt.ItemFlags(
+            Qt.ItemIsSelectable | Qt.ItemIsEnabled |
+            Qt.ItemNeverHasChildren)  # | Qt.ToolTip)  # ItemIsEditable
+        self._invalid_flags = Qt.ItemFlags(Qt.ItemIsEnabled)
+
+        app = QtWidgets.QApplication.instance()
+        if app:
+            app.paletteChanged.connect(self._reset_bad_brush)
+
+        # Resizing the columns to their contents measures every visible cell,
+        # so do it at most once per burst of changes, e.g. a full rebuild.
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.__resize_delay)
+        self._resize_timer.timeout.connect(self._resize_columns)
 
     @property
     def design(self):
         """Returns the design."""
-        return self.gui.design
+        return self._design
 
-    def _create_timer(self):
-        """Refresh the model number of rows, etc.
+    def set_design(self, design):
+        """Swap out reference to design.  Call refresh() to update the rows.
 
-        there must be a smarter way?
+        Args:
+            design (QDesign): The design
         """
-        self._timer = QtCore.QTimer(self)
-        self._timer.start(self.__timer_interval)
-        self._timer.timeout.connect(self.refresh_auto)
+        self._design = design
+        self._observe_design()
+
+    def _bad_brush(self) -> QBrush:
+        """Returns the background brush of a component that failed to build.
+
+        The brush blends the background color of the table view with red.
+        """
+        if not self._tableView:
+            return self._bad_brush_default
+        table = self._tableView
+        color = table.palette().color(table.backgroundRole())
+        rgba = color.rgba()
+        brush = _BLEND_CACHE.get(rgba)
+        if brush is None:
+            brush = QBrush(blend_colors(color, self._bad_color, r=0.6))
+            _BLEND_CACHE[rgba] = brush
+        return brush
+
+    def _reset_bad_brush(self, *args):
+        """Forget the blended brushes, and repaint the rows with the new
+        palette."""
+        _BLEND_CACHE.clear()
+        num_rows = len(self._keys_cache)
+        if num_rows:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(num_rows - 1, self._column_count - 1))
 
     def refresh(self):
         """Force refresh.
 
-        Completly rebuild the model.
+        Bring the rows in line with the components of the design, and have
+        the views repaint every row.  Rows are inserted and removed rather
+        than resetting the model, so the selection is kept.
         """
-        self.modelReset.emit()
+        self._observe_design()
+        if self._is_view_hidden():
+            self._needs_sync = True
+            return
+        self._needs_sync = False
+        self._sync_rows()
+        num_rows = len(self._keys_cache)
+        if num_rows:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(num_rows - 1, self._column_count - 1),
+                _CHANGED_ROLES)
+        self.update_view()
+
+    def _row_of(self, component_id: int) -> int:
+        """Returns the row of the component, or -1 if it has no row.
 
-    def refresh_auto(self):
-        """Automatic refresh, update row count, view, etc."""
-        # We could not do if the widget is hidden
-        new_count = self.rowCount()
+        Args:
+            component_id (int): Id of the component
+        """
+        if self._rows_by_id is None:
+            self._rows_by_id = {
+                key: row for row, key in enumerate(self._keys_cache)
+            }
+        return self._rows_by_id.get(component_id, -1)
+
+    def _row_info(self, component) -> _RowInfo:
+        """Returns the strings shown for the component that only change with
+        its name.
 
-        # if the number of rows have changed
-        if self._row_count != new_count:
-            #self.logger.info('Number of components changed')
+        The strings are computed once per component and name, rather than on
+        every paint.
 
-            # When a model is reset it should be considered that all
-            # information previously retrieved from it is invalid.
-            # This includes but is not limited to the rowCount() and
-            # columnCount(), flags(), data retrieved through data(), and roleNames().
-            # This will loose the current selection.
-            self.modelReset.emit()
+        Args:
+            component (QComponent): The component shown in the row
+        """
+        info = self._row_infos.get(component.id)
+        if (info is None or info.component is not component or
+                info.name != component.name):
+            info = _RowInfo(component, str(component.name),
+                            component.__class__.__name__,
+                            component.__class__.__module__)
+            self._row_infos[component.id] = info
+        return info
+
+    def _sync_rows(self):
+        """Insert and remove rows, in contiguous blocks, so that the rows
+        match the components of the design."""
+        self._rows_by_id = None
+        self._row_infos.clear()
+        keys = self._keys_cache
+        new_keys = list(self.design._components.keys()) if self.design else []
+        new_set = set(new_keys)
+
+        # Remove from the bottom up, so the rows above stay valid.
+        row = len(keys)
+        while row > 0:
+            row -= 1
+            if keys[row] not in new_set:
+                end = row
+                while row > 0 and keys[row - 1] not in new_set:
+                    row -= 1
+                self.beginRemoveRows(QModelIndex(), row, end)
+                del keys[row:end + 1]
+                self.endRemoveRows()
+
+        old_set = set(keys)
+        if [key for key in new_keys if key in old_set] != keys:
+            # The order of the remaining components changed, start over.
+            self.beginResetModel()
+            self._keys_cache = new_keys
+            self.endResetModel()
+            return
 
-            # for some reason the horizontal header is hidden even if i call this in init
-            self._tableView.horizontalHeader().show()
+        row = 0
+        num_new = len(new_keys)
+        while row < num_new:
+            if new_keys[row] in old_set:
+                row += 1
+                continue
+            start = row
+            while row < num_new and new_keys[row] not in old_set:
+                row += 1
+            self.beginInsertRows(QModelIndex(), start, row - 1)
+            keys[start:start] = new_keys[start:row]
+            self.endInsertRows()
+
+    def _is_view_hidden(self) -> bool:
+        """Returns True if the view exists but is not visible, i.e. its dock
+        is closed or behind another tab."""
+        return self._tableView is not None and not self._tableView.isVisible()
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Catch the view being shown, to apply the changes made while it
+        was hidden.
 
-            self._row_count = new_count
+        Args:
+            watched (QObject): The view
+            event (QEvent): The event
+
+        Returns:
+            bool: False, the event is never filtered out
+        """
+        if event.type() == QEvent.Show and self._needs_sync:
+            self.refresh()
+        return super().eventFilter(watched, event)
+
+    def _observe_design(self):
+        """Make sure the model is notified of the changes to the components
+        of the current design, and not of a previous design."""
+        design = self.design
+        if design is self._observed_design:
+            return
+        if self._observed_design is not None:
+            self._observed_design.remove_components_observer(
+                self._on_components_changed)
+        if design is not None:
+            design.add_components_observer(self._on_components_changed)
+        self._observed_design = design
+
+    def _on_components_changed(self, event: str, component_id: int):
+        """Called by the design when its components change.
+
+        Args:
+            event (str): What happened, see QDesign.add_components_observer
+            component_id (int): Id of the component that changed
+        """
+        if self._is_view_hidden():
+            # Rows are synced with the design by refresh() once shown.
+            self._needs_sync = True
+            return
+        if self._needs_sync:
+            self.refresh()
+            return
+
+        keys = self._keys_cache
+        if event == 'added':
+            row = len(keys)
+            self.beginInsertRows(QModelIndex(), row, row)
+            keys.append(component_id)
+            if self._rows_by_id is not None:
+                self._rows_by_id[component_id] = row
+            self.endInsertRows()
             self.update_view()
 
+        elif event == 'removed':
+            row = self._row_of(component_id)
+            if row >= 0:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del keys[row]
+                self._rows_by_id = None
+                self._row_infos.pop(component_id, None)
+                self.endRemoveRows()
+                self.update_view()
+
+        elif event == 'cleared':
+            if keys:
+                self.beginRemoveRows(QModelIndex(), 0, len(keys) - 1)
+                keys.clear()
+                self._rows_by_id = None
+                self._row_infos.clear()
+                self.endRemoveRows()
+                self.update_view()
+
+        else:  # renamed, replaced or rebuilt
+            row = self._row_of(component_id)
+            if row >= 0:
+                self.dataChanged.emit(self.index(row, 0),
+                                      self.index(row, self._column_count - 1))
+
     def update_view(self):
-        """Updates the view."""
+        """Updates the view.
+
+        The columns are resized once the current burst of changes is over.
+        """
         if self._tableView:
+            self._resize_timer.start()
+
+    def _resize_columns(self):
+        """Resize the columns of the view to their contents."""
+        if self._tableView and self._tableView.isVisible():
             self._tableView.resizeColumnsToContents()
 
     def rowCount(self, parent: QModelIndex = None):
@@ -125,7 +409,7 @@ class QTableModel_AllComponents(QAbstractTableModel):
             int: The number of rows
         """
         if self.design:  # should we just enforce this
-            num = int(len(self.design.components))
+            num = len(self._keys_cache)
             if num == 0:
                 self._tableView.show_placeholder_text()
             else:
@@ -144,7 +428,7 @@ class QTableModel_AllComponents(QAbstractTableModel):
         Returns:
             int: The number of columns
         """
-        return len(self.columns)
+        return self._column_count
 
     def headerData(self,
                    section,
@@ -163,15 +447,12 @@ class QTableModel_AllComponents(QAbstractTableModel):
 
         if role == Qt.DisplayRole:
             if orientation == Qt.Horizontal:
-                if section < len(self.columns):
-                    # print(self.columns[section])
-                    return self.columns[section]
+                if section < self._column_count:
+                    return self._column_tuple[section]
 
         elif role == Qt.FontRole:
             if section == 0:
-                font = QFont()
-                font.setBold(True)
-                return font
+                return self._bold_font
 
     def flags(self, index):
         """Set the item flags at the given index.
@@ -184,18 +465,16 @@ class QTableModel_AllComponents(QAbstractTableModel):
         """
         # https://doc.qt.io/qt-5/qt.html#ItemFlag-enum
 
-        if not index.isValid():
-            return Qt.ItemIsEnabled
-
-        return Qt.ItemFlags(
-            QAbstractTableModel.flags(self, index) |
-            Qt.ItemIsSelectable)  # | Qt.ToolTip)  # ItemIsEditable
+        return self._default_flags if index.isValid() else self._invalid_flags
 
     # @slot_catch_error()
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
         """Depending on the index and role given, return data. If not returning
         data, return None (PySide equivalent of QT's "invalid QVariant").
 
+        If the role is MULTIPLE_ROLES, return a dict with the data of all the
+        roles in ROLES_TO_PAINT, using a single lookup of the component.
+
         Returns:
             str: Data depending on the index and role
         """
@@ -203,50 +482,55 @@ class QTableModel_AllComponents(QAbstractTableModel):
         if not index.isValid() or not self.design:
             return
 
-        component_name = list(self.design.components.keys())[index.row()]
+        if index.row() >= len(self._keys_cache):
+            return
+        component = self.design._components.get(self._keys_cache[index.row()])
+        if component is None:
+            return
+
+        column = index.column()
+        info = self._row_info(component)
+        if role == MULTIPLE_ROLES:
+            return {
+                a_role: self._role_data(component, info, column, a_role)
+                for a_role in ROLES_TO_PAINT
+            }
 
+        return self._role_data(component, info, column, role)
+
+    def _role_data(self, component, info: _RowInfo, column: int, role: int):
+        """Return the data of the given component for the column and role.
+
+        Args:
+            component (QComponent): The component shown in the row
+            info (_RowInfo): The row info of the component, see _row_info
+            column (int): The column
+            role (int): The Qt role
+
+        Returns:
+            object: Data depending on the column and role, or None
+        """
         if role == Qt.DisplayRole:
 
-            if index.column() == 0:
-                return str(component_name)
-            elif index.column() == 1:
-                return str(
-                    self.design.components[component_name].__class__.__name__)
-            elif index.column() == 2:
-                return str(
-                    self.design.components[component_name].__class__.__module__)
-            elif index.column() == 3:
-                return str(self.design.components[component_name].status)
-            elif index.column() == 4:
-                return str(self.design.components[component_name].id)
+            if column < self._column_count:
+                return _DISPLAY_FNS[column](component, info)
 
         # The font used for items rendered with the default delegate. (QFont)
         elif role == Qt.FontRole:
-            if index.column() == 0:
-                font = QFont()
-                font.setBold(True)
-                return font
+            if column == 0:
+                return self._bold_font
 
         elif role == Qt.BackgroundRole:
 
-            component = self.design.components[component_name]
             if component.status != 'good':  # Did the component fail the build
                 #    and index.column()==0:
-                if not self._tableView:
-                    return QBrush(QColor('#FF0000'))
-                table = self._tableView
-                color = table.palette().color(table.backgroundRole())
-                color = blend_colors(color, QColor('#FF0000'), r=0.6)
-                return QBrush(color)
+                return self._bad_brush()
 
         elif role == Qt.DecorationRole:
 
-            if index.column() == 0:
-                component = self.design.components[component_name]
+            if column == 0:
                 if component.status != 'good':  # Did the component fail the build
-                    return QIcon(":/sample_shapes/warning")
+                    return self._warn_icon
 
         elif role == Qt.ToolTipRole or role == Qt.StatusTipRole:
-            component = self.design.components[component_name]
-            text = f"""Component name= "{component.name}" instance of class "{component.__class__.__name__}" from module "{component.__class__.__module__}" """
-            return text
+            return info.tooltip
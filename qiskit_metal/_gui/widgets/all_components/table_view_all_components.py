@@ -20,7 +20,7 @@ from PySide2.QtCore import QModelIndex, Qt, QTimer
 from PySide2.QtGui import QContextMenuEvent
 from PySide2.QtWidgets import (QInputDialog, QLabel, QLineEdit, QMenu,
                                QMessageBox, QTableView, QVBoxLayout,
-                               QAbstractItemView)
+                               QAbstractItemView, QHeaderView)
 
 from ...utility._handle_qt_messages import slot_catch_error
 from ..bases.QWidget_PlaceholderText import QWidget_PlaceholderText
@@ -63,9 +63,16 @@ class QTableView_AllComponents(QTableView, QWidget_PlaceholderText):
     def style2(self):
         """Style the widget."""
         # Do in the ui file
-        self.horizontalHeader().hide()
+        header = self.horizontalHeader()
+        header.show()
         self.verticalHeader().show()
 
+        # Fixed initial widths: the user can resize the columns, and the
+        # model resizes them to their contents only after a burst of changes.
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        for column, width in enumerate(self.model().column_widths):
+            header.resizeSection(column, width)
+
         self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
 
@@ -12,6 +12,8 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
+from itertools import islice
+
 from PySide2 import QtCore
 from PySide2.QtCore import QAbstractTableModel, QModelIndex, Qt
 from PySide2.QtGui import QFont
@@ -122,14 +124,16 @@ class PropValTable(QAbstractTableModel):
         column = index.column()
 
         if role == Qt.DisplayRole:
+            # Walk to the row's key without building the list of all keys.
+            key = next(islice(self._data, row, None), None)
+            if key is None:
+                return
             if column == 0:
-                return str(list(self._data.keys())[row])
+                return str(key)
             elif column == 1:
-                return str(self._data[list(self._data.keys())[row]])
+                return str(self._data[key])
             elif column == 2:
-                return str(
-                    self.design.parse_value(self._data[list(
-                        self._data.keys())[row]]))
+                return str(self.design.parse_value(self._data[key]))
 
         # double clicking
         elif role == Qt.EditRole:
@@ -14,10 +14,13 @@
 """The base class of all QDesigns in Qiskit Metal."""
 
 import importlib
-#import inspect
+import inspect
+import weakref
 #import os
+from collections import OrderedDict
+from copy import deepcopy
 from datetime import datetime
-from typing import Any, Dict as Dict_, Iterable, List, TYPE_CHECKING, Union
+from typing import Any, Callable, Dict as Dict_, Iterable, List, TYPE_CHECKING, Union
 
 import pandas as pd
 
@@ -112,9 +115,19 @@ class QDesign():
         # Cache for component ids.  Hold the reverse of _components dict,
         self.name_to_id = Dict()
 
+        # Weak references to the callables notified when components are added,
+        # removed, renamed, replaced or rebuilt, i.e. by the GUI. These are not
+        # saved.
+        self._components_observers = []
+
         self._variables = Dict()
         self._chips = Dict()
 
+        # Strings already parsed by parse_value, valid for the variables
+        # they were parsed with.
+        self._parse_cache = OrderedDict()
+        self._parse_cache_variables = None
+
         self._metadata = self._init_metadata()
         if metadata:
             self.update_metadata(metadata)
@@ -293,6 +306,90 @@ class QDesign():
 
 #########General methods###################################################
 
+    def __getstate__(self) -> dict:
+        """State pickled by save_metal and copied by deepcopy.  The observers
+        belong to the current session, i.e. to an open GUI, and the cache of
+        parse_value is rebuilt on demand, so they are left out.
+
+        Returns:
+            dict: The attributes of the design
+        """
+        state = self.__dict__.copy()
+        state.pop('_components_observers', None)
+        state.pop('_parse_cache', None)
+        state.pop('_parse_cache_variables', None)
+        return state
+
+    def __setstate__(self, state: dict):
+        """Restore the state from __getstate__, without any observers and
+        with an empty cache of parse_value.
+
+        Args:
+            state (dict): The attributes of the design
+        """
+        self.__dict__.update(state)
+        self._components_observers = []
+        self._parse_cache = OrderedDict()
+        self._parse_cache_variables = None
+
+    def add_components_observer(self, observer: Callable[[str, int], None]):
+        """Register a callable to be notified when the components change.
+
+        The observer is called as observer(event, component_id), where event
+        is one of 'added', 'removed', 'renamed', 'replaced', 'rebuilt' or
+        'cleared'.  For 'cleared', component_id is None.
+
+        The design only keeps a weak reference to the observer, so that it
+        does not keep alive i.e. the model of a closed GUI.  The caller has to
+        keep the observer alive for as long as it should be notified.
+
+        Args:
+            observer (Callable): Called after each change of the components.
+        """
+        if any(ref() == observer for ref in self._components_observers):
+            return
+        if inspect.ismethod(observer):
+            # A bound method is created anew on each attribute access
+            self._components_observers.append(weakref.WeakMethod(observer))
+        else:
+            self._components_observers.append(weakref.ref(observer))
+
+    def remove_components_observer(self, observer: Callable[[str, int], None]):
+        """Stop notifying a callable registered with add_components_observer.
+
+        Args:
+            observer (Callable): The observer to remove.
+        """
+        self._components_observers = [
+            ref for ref in self._components_observers
+            if ref() not in (None, observer)
+        ]
+
+    def _notify_components_observers(self,
+                                     event: str,
+                                     component_id: int = None):
+        """Tell every registered observer that the components have changed.
+
+        Args:
+            event (str): What happened, see add_components_observer.
+            component_id (int): Id of the component that changed.  Defaults to None.
+        """
+        # Forget the observers that no longer exist
+        self._components_observers = [
+            ref for ref in self._components_observers if ref() is not None
+        ]
+        for ref in self._components_observers:
+            observer = ref()
+            if observer is not None:
+                # An observer, i.e. a GUI callback, must not break the change
+                # of the components, nor hide the error of a build.
+                try:
+                    observer(event, component_id)
+                except Exception as error:  # pylint: disable=broad-except
+                    self.logger.error(
+                        f'ERROR in components observer {observer} for '
+                        f'event={event}, component_id={component_id}: {error}')
+
     def rename_variable(self, old_key: str, new_key: str):
         """Renames a variable in the variables dictionary. Preserves order.
 
@@ -435,6 +532,8 @@ class QDesign():
 
         self._qgeometry.clear_all_tables()
 
+        self._notify_components_observers('cleared')
+
     def _get_new_qcomponent_id(self):
         """Give new id that QComponent can use.
 
@@ -487,12 +586,13 @@ class QDesign():
         # We are using component_id,
         # and assuming id is created as being unique.
         # We also want the string (name) to be unique.
+        components = self._components
 
         if isinstance(component_id, int):
             a_component_id = component_id
         elif isinstance(component_id, str):
             component_name = str(component_id)
-            a_component_id = self.name_to_id[component_name]
+            a_component_id = self.name_to_id.get(component_name)
             if a_component_id is None:
                 return -3
         else:
@@ -501,25 +601,27 @@ class QDesign():
                 f' is not an integer, nor a string.')
             return -3
 
-        if a_component_id in self._components:
+        if a_component_id in components:
             # Check if name is already being used.
-            if new_component_name in self.name_to_id:
-                logger.warning(
-                    f'Called design.rename_component,'
-                    f' component_id({self.name_to_id[new_component_name]}'
-                    f',  is already using {new_component_name}.')
+            name_to_id = self.name_to_id
+            if new_component_name in name_to_id:
+                logger.warning(f'Called design.rename_component,'
+                               f' component_id({name_to_id[new_component_name]}'
+                               f',  is already using {new_component_name}.')
                 return -2
 
             # Do rename
-            a_component = self._components[a_component_id]
+            a_component = components[a_component_id]
 
             # Remove old name from cache, add new name
-            self.name_to_id.pop(a_component.name, None)
-            self.name_to_id[new_component_name] = a_component.id
+            name_to_id.pop(a_component.name, None)
+            name_to_id[new_component_name] = a_component.id
 
             # do rename
             # pylint: disable=protected-access
-            self._components[component_id]._name = new_component_name
+            a_component._name = new_component_name
+
+            self._notify_components_observers('renamed', a_component_id)
 
             return True
         logger.warning(
@@ -577,33 +679,37 @@ class QDesign():
         # if is on the net list or not
 
         return_response = False
+        components = self._components
 
-        if component_id in self._components:
+        if component_id in components:
             # id in components dict
             # Need to remove pins before popping component.
 
             # For components to delete, which  connected to any other component,
             # need to set the net_id to zero of OTHER component
             #  before deleting from net_id table.
-            for pin_name in self._components[component_id].pins:
+            # Look up all the nets of the component in a single pass over the
+            # table, rather than copying and filtering the table for each pin.
+            net_ids = {
+                pin.net_id
+                for pin in components[component_id].pins.values()
+                if pin.net_id
+            }
+            if net_ids:
+                # pylint: disable=protected-access
+                df_net_info = self._qnet._net_info
+                delete_these_pins = df_net_info[
+                    df_net_info['net_id'].isin(net_ids) &
+                    (df_net_info['component_id'] != component_id)]
+
                 # make net_id be zero for every component which is connected to it.
-                net_id_search = self._components[component_id].pins[
-                    pin_name].net_id
-                df_subset_based_on_net_id = self.net_info[(
-                    self.net_info['net_id'] == net_id_search)]
-                delete_this_pin = df_subset_based_on_net_id[(
-                    df_subset_based_on_net_id['component_id'] != component_id)]
-
-                # If Component is connected to anything, meaning it is part of net_info
-                # table.
-                if not delete_this_pin.empty:
-                    edit_component = list(delete_this_pin['component_id'])[0]
-                    edit_pin = list(delete_this_pin['pin_name'])[0]
-
-                    if self._components[edit_component]:
-                        if self._components[edit_component].pins[edit_pin]:
-                            self._components[edit_component].pins[
-                                edit_pin].net_id = 0
+                for edit_component, edit_pin in zip(
+                        delete_these_pins['component_id'],
+                        delete_these_pins['pin_name']):
+                    a_component = components[edit_component]
+                    if a_component:
+                        if a_component.pins[edit_pin]:
+                            a_component.pins[edit_pin].net_id = 0
 
             # pins of component to delete.
             self._qnet.delete_all_pins_for_component(component_id)
@@ -613,11 +719,13 @@ class QDesign():
             self._qgeometry.delete_component_id(component_id)
 
             # Before poping component from design registry, remove name from cache
-            component_name = self._components[component_id].name
+            component_name = components[component_id].name
             self.name_to_id.pop(component_name, None)
 
             # remove from design dict of components
-            self._components.pop(component_id, None)
+            components.pop(component_id, None)
+
+            self._notify_components_observers('removed', component_id)
         else:
             # if not in components dict
             logger.warning(
@@ -811,7 +919,20 @@ class QDesign():
             See the docstring for this module.
                 qiskit_metal.toolbox_metal.parsing
         """
-        return parse_value(value, self.variables)
+        return parse_value(value, self.variables, self._get_parse_cache())
+
+    def _get_parse_cache(self) -> OrderedDict:
+        """Cache of the strings parsed by parse_value. It is emptied first if
+        the variables changed since it was filled, in whichever way they were
+        changed.
+
+        Returns:
+            OrderedDict: Parsed value of each cached string
+        """
+        if self._variables != self._parse_cache_variables:
+            self._parse_cache.clear()
+            self._parse_cache_variables = deepcopy(self._variables)
+        return self._parse_cache
 
     def parse_options(self, params: dict, param_names: str) -> dict:
         """Extra utility function that can call parse_value on individual
@@ -188,6 +188,7 @@ class Components:
                 f'The name={name} already exists in design._components.  '
                 f'A component_id={component_id} will be replaced.')
             self.components[component_id] = deepcopy(value)
+            self._design._notify_components_observers('replaced', component_id)
         else:
             self.logger.warning(
                 f'Usualy new components are added to design during init.  '
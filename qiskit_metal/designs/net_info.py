@@ -113,18 +113,26 @@ class QNet():
             return 0
 
         # Confirm the component-pin combination is NOT in _net_info, before adding them.
-        for (net_identity, component_id,
-             pin_name) in self._net_info.itertuples(index=False):
-            if ((component_id == comp1_id) and (pin_name == pin1_name)):
+        # Compare whole columns at once, rather than row by row.
+        net_info = self._net_info
+        component_ids = net_info['component_id']
+        pin_names = net_info['pin_name']
+        is_pin1 = (component_ids == comp1_id) & (pin_names == pin1_name)
+        is_pin2 = (component_ids == comp2_id) & (pin_names == pin2_name)
+        in_use = is_pin1 | is_pin2
+        if in_use.any():
+            # Report the first row found, as when looping over the rows.
+            first = in_use.values.argmax()
+            net_identity = net_info['net_id'].iloc[first]
+            if is_pin1.iloc[first]:
                 self.logger.warning(
                     f'Component: {comp1_id} and pin: {pin1_name} are '
                     f'already in net_info with net_id {net_identity}')
-                return 0
-            if ((component_id == comp2_id) and (pin_name == pin2_name)):
+            else:
                 self.logger.warning(
                     f'Component: {comp2_id} and pin: {pin2_name} are '
                     f'already in net_info with net_id {net_identity}')
-                return 0
+            return 0
 
         net_id = self._get_new_net_id()
 
@@ -157,13 +165,15 @@ class QNet():
         Returns:
             set: All deleted ids
         """
-        all_net_id_deleted = set()
-
-        for (net_identity, component_id,
-             dummy_pin_name) in self._net_info.itertuples(index=False):
-            if component_id == component_id_to_remove:
-                all_net_id_deleted.add(net_identity)
-                self.delete_net_id(net_identity)
+        net_info = self._net_info
+        is_removed = net_info['component_id'] == component_id_to_remove
+        all_net_id_deleted = set(net_info.loc[is_removed, 'net_id'])
+
+        # Drop both entries of every net in one pass over the table.
+        if all_net_id_deleted:
+            net_info.drop(
+                net_info.index[net_info['net_id'].isin(all_net_id_deleted)],
+                inplace=True)
 
         return all_net_id_deleted
 
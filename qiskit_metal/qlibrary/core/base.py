@@ -20,6 +20,7 @@ To see the docstring of QComponent in Jupyter notebook, use:
 
 import logging
 import inspect
+import math
 import random
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Iterable, List, Union, Tuple, Dict as Dict_
@@ -433,6 +434,7 @@ class QComponent():
         # pylint: disable=protected-access
         self.design._components[self.id] = self
         self.design.name_to_id[self.name] = self._id
+        self.design._notify_components_observers('added', self.id)
 
     @classmethod
     def get_template_options(cls,
@@ -721,8 +723,13 @@ name='{strname}'{other_args}
             self.design.build_logs.add_error(
                 f"{str(datetime.now())} -- Component: {self.name} failed with error\n: {error}"
             )
+            # pylint: disable=protected-access
+            self.design._notify_components_observers('rebuilt', self.id)
             raise error
 
+        # pylint: disable=protected-access
+        self.design._notify_components_observers('rebuilt', self.id)
+
     def delete(self):
         """Delete the QComponent.
 
@@ -899,10 +906,12 @@ name='{strname}'{other_args}
         points = np.around(
             points, rounding_val)  #Need points to remain as shapely geom?
 
+        # The vectors below have only two coordinates: math.hypot is much
+        # cheaper than the dispatch of np.linalg.norm and np.sum.
         if input_as_norm:
             middle_point = points[1]
             vec_normal = points[1] - points[0]
-            vec_normal /= np.linalg.norm(vec_normal)
+            vec_normal /= math.hypot(vec_normal[0], vec_normal[1])
 
             s_point = np.round(Vector.rotate(
                 vec_normal, (np.pi / 2))) * width / 2 + points[1]
@@ -912,10 +921,17 @@ name='{strname}'{other_args}
             tangent_vector = Vector.rotate(vec_normal, np.pi / 2)
 
         else:
-            vec_dist, tangent_vector, vec_normal = draw.Vector.two_points_described(
-                points)
-            middle_point = np.sum(points, axis=0) / 2.
-            width = np.linalg.norm(vec_dist)
+            vec_dist = points[1] - points[0]
+            width = math.hypot(vec_dist[0], vec_dist[1])
+            if width:
+                tangent_vector = vec_dist / width
+                vec_normal = np.round(Vector.rotate(tangent_vector, np.pi / 2),
+                                      decimals=11)
+            else:
+                # Same points, let Vector report the zero length vector.
+                vec_dist, tangent_vector, vec_normal = draw.Vector.two_points_described(
+                    points)
+            middle_point = (points[0] + points[1]) * 0.5
 
         pin_dict = Dict(
             points=points,
@@ -21,7 +21,9 @@
 # pylint: disable-msg=import-error
 """Qiskit Metal unit tests analyses functionality."""
 
+import gc
 import unittest
+from copy import deepcopy
 import pandas as pd
 
 from qiskit_metal.designs.design_base import QDesign
@@ -174,6 +176,10 @@ class TestDesign(unittest.TestCase, AssertionsMixin):
         self.assertEqual('new-name' in design.name_to_id, True)
         self.assertEqual('my_name-1' in design.name_to_id, False)
         self.assertEqual('my_name-2' in design.name_to_id, True)
+        self.assertEqual(design.components['new-name'].name, 'new-name')
+        self.assertEqual(len(design._components), 2)
+
+        self.assertEqual(design.rename_component('no-name', 'name'), -3)
 
     def test_design_default_component_name(self):
         """Test automatic naming of components."""
@@ -218,6 +224,120 @@ class TestDesign(unittest.TestCase, AssertionsMixin):
         self.assertEqual('my_name-1' in design.name_to_id, False)
         self.assertEqual('my_name-2' in design.name_to_id, False)
 
+    def test_design_components_observers(self):
+        """Test add_components_observer in design_base.py."""
+        design = DesignPlanar(metadata={})
+        events = []
+
+        def observer(event, component_id):
+            events.append((event, component_id))
+
+        design.add_components_observer(observer)
+        design.add_components_observer(observer)
+        QComponent(design, 'my_name-1', make=False)
+        QComponent(design, 'my_name-2', make=False)
+        design.rename_component('my_name-1', 'my_name-3')
+        design.delete_component('my_name-2')
+        design.delete_all_components()
+        design.remove_components_observer(observer)
+        QComponent(design, 'my_name-4', make=False)
+
+        self.assertEqual(events, [('added', 1), ('added', 2), ('renamed', 1),
+                                  ('removed', 2), ('cleared', None)])
+
+    def test_design_components_observers_weak(self):
+        """Test that design_base.py does not keep its observers alive."""
+        design = DesignPlanar(metadata={})
+
+        class Observer:
+            """Observer of the components, such as a table model."""
+
+            def __init__(self):
+                self.events = []
+
+            def on_components_changed(self, event, component_id):
+                """Record the event."""
+                self.events.append((event, component_id))
+
+        observer = Observer()
+        events = observer.events
+        design.add_components_observer(observer.on_components_changed)
+        QComponent(design, 'my_name-1', make=False)
+        self.assertEqual(events, [('added', 1)])
+
+        del observer
+        gc.collect()
+        QComponent(design, 'my_name-2', make=False)
+
+        self.assertEqual(events, [('added', 1)])
+        self.assertEqual(design._components_observers, [])
+
+    def test_design_components_observers_error(self):
+        """Test that design_base.py isolates the errors of its observers."""
+        design = DesignPlanar(metadata={})
+
+        def observer(event, component_id):
+            raise ValueError(f'{event} {component_id}')
+
+        design.add_components_observer(observer)
+        with self.assertLogs(design.logger, level='ERROR'):
+            QComponent(design, 'my_name-1', make=False)
+        with self.assertLogs(design.logger, level='ERROR'):
+            design.delete_component('my_name-1')
+
+        self.assertEqual('my_name-1' in design.name_to_id, False)
+
+    def test_design_components_observers_deepcopy(self):
+        """Test that design_base.py does not copy its observers."""
+        design = DesignPlanar(metadata={})
+        QComponent(design, 'my_name-1', make=False)
+
+        class Observer:
+            """Observer of the components, such as a table model."""
+
+            def __init__(self):
+                self.events = []
+
+            def on_components_changed(self, event, component_id):
+                """Record the event."""
+                self.events.append((event, component_id))
+
+        observer = Observer()
+        design.add_components_observer(observer.on_components_changed)
+
+        design_copy = deepcopy(design)
+        self.assertEqual(design_copy._components_observers, [])
+        QComponent(design_copy, 'my_name-2', make=False)
+        self.assertEqual(observer.events, [])
+
+        design.components['my_name-1'] = design.components['my_name-1']
+        self.assertEqual(observer.events, [('replaced', 1)])
+        self.assertEqual(len(design._components_observers), 1)
+
+    def test_design_parse_value_cache(self):
+        """Test the cache of parse_value in design_base.py."""
+        design = DesignPlanar(metadata={})
+        design.variables['my_width'] = '10um'
+
+        self.assertAlmostEqual(design.parse_value('my_width'), 0.01)
+        self.assertAlmostEqual(design.parse_value(['my_width'])[0], 0.01)
+        self.assertIn('my_width', design._parse_cache)
+
+        design.variables['my_width'] = '20um'
+        self.assertAlmostEqual(design.parse_value('my_width'), 0.02)
+
+        design.rename_variable('my_width', 'my_length')
+        self.assertEqual(design.parse_value('my_width'), 'my_width')
+        self.assertAlmostEqual(design.parse_value('my_length'), 0.02)
+
+        parsed = design.parse_value('[1, 2]')
+        parsed.append(3)
+        self.assertEqual(design.parse_value('[1, 2]'), [1, 2])
+
+        design_copy = deepcopy(design)
+        self.assertEqual(len(design_copy._parse_cache), 0)
+        self.assertAlmostEqual(design_copy.parse_value('my_length'), 0.02)
+
     def test_design_get_and_set_design_name(self):
         """Test getting the design name in design_base.py."""
         design = DesignPlanar(metadata={})
@@ -305,6 +425,20 @@ class TestDesign(unittest.TestCase, AssertionsMixin):
             for j in ['net_id', 'component_id', 'pin_name']:
                 self.assertEqual(df_expected[j][i], df[j][i])
 
+    def test_design_qnet_add_pins_to_table_duplicate(self):
+        """Test add_pins_to_table in net_info.py with pins already in use."""
+        qnet = QNet()
+        net_id = qnet.add_pins_to_table(1, 'my_name-1', 2, 'my_name-2')
+        self.assertNotEqual(net_id, 0)
+
+        self.assertEqual(qnet.add_pins_to_table(1, 'my_name-1', 3, 'my_name-3'),
+                         0)
+        self.assertEqual(qnet.add_pins_to_table(3, 'my_name-3', 2, 'my_name-2'),
+                         0)
+        self.assertEqual(len(qnet.net_info), 2)
+        self.assertNotEqual(
+            qnet.add_pins_to_table(1, 'my_name-3', 3, 'my_name-1'), 0)
+
     def test_design_qnet_delete_net_id(self):
         """Test delete a given net id in net_info.py."""
         design = DesignPlanar(metadata={})
@@ -465,6 +599,20 @@ class TestDesign(unittest.TestCase, AssertionsMixin):
         self.assertEqual(pf['pin_name'][0], 'p1')
         self.assertEqual(pf['pin_name'][1], 'p2')
 
+    def test_design_delete_connected_component(self):
+        """Test deleting a component with a connected pin in design_base.py."""
+        design = DesignPlanar()
+        design.overwrite_enabled = True
+
+        TransmonPocket(design, 'Q1')
+        TransmonPocket(design, 'Q2')
+
+        design.connect_pins(1, 'p1', 2, 'p2')
+        design.delete_component('Q1')
+
+        self.assertEqual(design._components[2].pins['p2'].net_id, 0)
+        self.assertTrue(design._qnet._net_info.empty)
+
     def test_design_delete_all_pins(self):
         """Test delete_all_pins functionality in design_base.py."""
         design = DesignPlanar()
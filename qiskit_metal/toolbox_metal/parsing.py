@@ -169,6 +169,7 @@ Returns:
         'dict1': {'key1': 4e-06, '2mm': 0.1}}
 """
 
+from collections import OrderedDict
 from collections.abc import Iterable
 from collections.abc import Mapping
 from numbers import Number
@@ -219,6 +220,9 @@ UREG = pint.UnitRegistry()
 
 units = config.DefaultMetalOptions.default_generic.units
 
+# Most entries kept by the `cache` of `parse_value`
+PARSE_CACHE_SIZE = 8192
+
 
 def _parse_string_to_float(expr: str):
     """Extract the value of a string.
@@ -301,7 +305,7 @@ def is_numeric_possible(test_str: str):
 
 # pylint: disable-msg=too-many-branches
 # pylint: disable-msg=too-many-return-statements
-def parse_value(value: str, variable_dict: dict):
+def parse_value(value: str, variable_dict: dict, cache: OrderedDict = None):
     """Parse a string, mappable (dict, Dict), iterable (list, tuple) to account
     for units conversion, some basic arithmetic, and design variables. This is
     the main parsing function of Qiskit Metal.
@@ -337,6 +341,10 @@ def parse_value(value: str, variable_dict: dict):
     Args:
         value (str): String to parse
         variable_dict (dict): dict pointer of variables
+        cache (OrderedDict): Memo of already parsed strings, reused across
+            calls and evicted oldest first past `PARSE_CACHE_SIZE` entries.
+            The caller must empty it when `variable_dict` changes.
+            Defaults to None, for no caching.
 
     Return:
         str, float, list, tuple, or ast eval: Parsed value
@@ -344,6 +352,17 @@ def parse_value(value: str, variable_dict: dict):
 
     if isinstance(value, str):
 
+        if cache is not None:
+            parsed = cache.get(value)
+            if parsed is None:
+                parsed = parse_value(value, variable_dict)
+                # Lists and Dicts are mutable, so the caller gets a fresh one
+                if isinstance(parsed, (str, Number)):
+                    cache[value] = parsed
+                    if len(cache) > PARSE_CACHE_SIZE:
+                        cache.popitem(last=False)
+            return parsed
+
         # remove trailing and leading white spaces in the name
         val = str(value).strip()
 
@@ -394,15 +413,15 @@ def parse_value(value: str, variable_dict: dict):
         return Dict(
             map(
                 lambda item:  # item = [key, value]
-                [item[0], parse_value(item[1], variable_dict)],
+                [item[0], parse_value(item[1], variable_dict, cache)],
                 value.items()))
 
     elif isinstance(value, Iterable):
         # list, tuple, ... Return the same type
         return {
             np.ndarray: np.array
-        }.get(type(value),
-              type(value))([parse_value(val, variable_dict) for val in value])
+        }.get(type(value), type(value))(
+            [parse_value(val, variable_dict, cache) for val in value])
 
     elif isinstance(value, Number):
         # If it is an int it will return an int, not a float, etc.